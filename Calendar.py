@@ -0,0 +1,92 @@
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytz
+
+timezone = pytz.timezone('Australia/Brisbane')
+
+# Maximum number of calendar indexes kept by getCalendarIndex
+_cache_size = 32
+_calendar_cache = {}
+
+
+def billingPeriod(year, month):
+    # Billing periods run from billing_day of one month up to billing_day of the next.
+    # The id is the number of months since year 0 of the month the period starts in
+    return year * 12 + (month - 1)
+
+
+class CalendarIndex:
+    # Local calendar fields for a time axis of epoch seconds, converted in one vectorized pass
+
+    def __init__(self, times, tz=timezone, billing_day=1):
+        self.times = times
+        self.tz = tz
+        self.billing_day = billing_day
+
+        local = pd.to_datetime(times, unit='s', utc=True).tz_convert(tz).tz_localize(None)
+
+        # naive local wall clock times (for plotting)
+        self.local_time = local.to_numpy()
+        # local date as days since 1970-01-01
+        self.date = self.local_time.astype('datetime64[D]').astype(np.int64)
+        self.hour = local.hour.to_numpy()
+        self.weekday = local.weekday.to_numpy()
+        self.month = local.month.to_numpy()
+        self.year = local.year.to_numpy()
+
+        # days before billing_day belong to the period that started in the previous month
+        day = local.day.to_numpy()
+        self.billing_period = billingPeriod(self.year, self.month) - (day < billing_day)
+
+        # The index is cached and shared between callers, so none of its arrays may be modified
+        for array in (self.local_time, self.date, self.hour, self.weekday, self.month, self.year,
+                      self.billing_period):
+            array.setflags(write=False)
+
+    def __len__(self):
+        return len(self.times)
+
+
+def getCalendarIndex(times, tz=timezone, billing_day=1):
+    # Memoized per (time axis, timezone, billing day)
+    times_bytes = np.ascontiguousarray(times, dtype=np.int64).tobytes()
+    key = (times_bytes, str(tz), billing_day)
+
+    calendar = _calendar_cache.get(key)
+    if calendar is None:
+        # frombuffer gives a read-only copy of the axis that the cache owns
+        calendar = CalendarIndex(np.frombuffer(times_bytes, dtype=np.int64), tz, billing_day)
+        if len(_calendar_cache) >= _cache_size:
+            # drop the oldest index
+            del _calendar_cache[next(iter(_calendar_cache))]
+        _calendar_cache[key] = calendar
+
+    return calendar
+
+
+def localToEpoch(local_times, tz=timezone):
+    # Convert naive local wall clock times to epoch seconds. Only the unique times are localized
+    if isinstance(local_times, datetime):
+        return int(localToEpoch([local_times], tz)[0])
+
+    local_times = pd.DatetimeIndex(local_times)
+    unique_times = local_times.unique()
+    # normalize to seconds, as the DatetimeIndex keeps the resolution of its input
+    epochs = unique_times.tz_localize(tz).as_unit('s').asi8
+
+    return epochs[unique_times.get_indexer(local_times)]
+
+
+def monthBoundaries(start_timestamp: int, end_timestamp: int, months: int = 1, tz=timezone):
+    # Epoch second boundaries of local calendar months, every `months` months, covering start to end
+    start_time = pd.Timestamp(start_timestamp, unit='s', tz='UTC').tz_convert(tz).tz_localize(None)
+    end_time = pd.Timestamp(end_timestamp, unit='s', tz='UTC').tz_convert(tz).tz_localize(None)
+
+    # floor the start time to the nearest month
+    start_time = start_time.to_period('M').to_timestamp()
+
+    starts = pd.date_range(start_time, end_time, freq=f'{months}MS')
+    boundaries = starts.append(pd.DatetimeIndex([starts[-1] + pd.DateOffset(months=months)]))
+
+    return localToEpoch(boundaries, tz)
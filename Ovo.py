@@ -7,11 +7,8 @@ import bs4
 import json
 import pandas as pd
 import logging
-import pytz
-from datetime import datetime, timedelta
 import numpy as np
-
-timezone = pytz.timezone('Australia/Brisbane')
+from Calendar import timezone, localToEpoch
 
 class Ovo:
 
@@ -181,10 +178,8 @@ class Ovo:
         # sort by time
         df = df.sort_values('time')
 
-        # adjust for timezone (using the timezone variable)
-        df["time"] = df["time"].dt.tz_localize(timezone).dt.tz_convert('UTC')
-
-        df["time"] = df["time"].astype(int) // 10 ** 9
+        # adjust for timezone and convert to epoch (using the timezone variable)
+        df["time"] = localToEpoch(df["time"], timezone)
 
         # unique times
         unique_times = df['time'].unique()
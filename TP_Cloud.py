@@ -2,12 +2,10 @@ import requests
 import uuid
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import math
-import pytz
+from Calendar import timezone, monthBoundaries
 wap_url = "https://n-wap-gw.tplinkcloud.com"
 app_version = "3.8.509"
-timezone = pytz.timezone('Australia/Brisbane')
 
 class TP_Cloud:
 
@@ -162,19 +160,9 @@ class TP_Cloud:
 
         iot_app_server_url = self.appServiceUrl['nbu.iot-app-server.app']
 
-        start_time = datetime.fromtimestamp(start_timestamp, tz=timezone)
-        end_time = datetime.fromtimestamp(end_timestamp, tz=timezone)
-
-        # floor the start time to the nearest month
-        start_time = start_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        time_ranges = []
-        month_interval = 3
-        while start_time <= end_time:
-            # Create a new end time 3 months later
-            new_end_time = (start_time + timedelta(days=30*month_interval+1)).replace(day=1)
-            time_ranges.append((start_time.astimezone(pytz.utc).timestamp(), new_end_time.astimezone(pytz.utc).timestamp()))
-            start_time = new_end_time
+        # Local month boundaries, 3 months apart, starting from the month containing the start time
+        boundaries = monthBoundaries(start_timestamp, end_timestamp, months=3, tz=timezone)
+        time_ranges = list(zip(boundaries[:-1], boundaries[1:]))
 
         energy_data = []
         for start, end in time_ranges:
@@ -7,7 +7,8 @@ from tapo.requests import EnergyDataInterval
 from Ovo import Ovo
 import matplotlib.pyplot as plt
 import logging
-from TP_Cloud import TP_Cloud, timezone
+from TP_Cloud import TP_Cloud
+from Calendar import timezone, getCalendarIndex, billingPeriod
 import pytz
 from tabulate import tabulate
 
@@ -70,13 +71,11 @@ def plotUsage(df, min_time=None, max_time=None):
         df = df[df.index >= min_time]
     if max_time is not None:
         df = df[df.index <= max_time]
-    max_time = df.index.max()
-    min_time = df.index.min()
 
-    # Convert min_time and max_time to datetime
-    min_time = pd.to_datetime(min_time, unit='s') + timedelta(hours=10) # Adjust for timezone
-    max_time = pd.to_datetime(max_time, unit='s') + timedelta(hours=10) # Adjust for timezone
-    date_time = pd.to_datetime(df.index, unit='s') + timedelta(hours=10) # Adjust for timezone
+    # Convert the times to local datetimes
+    date_time = getCalendarIndex(df.index, timezone).local_time
+    min_time = date_time.min()
+    max_time = date_time.max()
 
     # create a stacked bar chart
     fig, ax = plt.subplots()
@@ -184,22 +183,17 @@ async def main():
     for col in measured_power:
         merged_energy_data["Unknown"] -= merged_energy_data[col]
 
-    start_billing_period = datetime(2025, 1, 16, tzinfo=timezone)
-    end_billing_period = datetime(2025, 2, 16, tzinfo=timezone)
+    # The billing period starting on 16/01/2025 (up to but not including 16/02/2025)
+    billing_day = 16
+    billing_period = billingPeriod(2025, 1)
 
-    start_billing_period = start_billing_period.astimezone(pytz.utc)
-    end_billing_period = end_billing_period.astimezone(pytz.utc)
-
-    start_billing_period = start_billing_period.timestamp()
-    end_billing_period = end_billing_period.timestamp()
+    calendar = getCalendarIndex(merged_energy_data.index, timezone, billing_day=billing_day)
+    merged_energy_data = merged_energy_data[calendar.billing_period == billing_period]
 
     # plot the billing period
-    #plotUsage(merged_energy_data, min_time=start_billing_period, max_time=end_billing_period)
+    #plotUsage(merged_energy_data)
 
     # Generate some stats
-    merged_energy_data = merged_energy_data[merged_energy_data.index >= start_billing_period]
-    merged_energy_data = merged_energy_data[merged_energy_data.index <= end_billing_period]
-
     print("Total usage:")
     print(tabulate(merged_energy_data.sum().to_frame(), headers = 'keys', tablefmt = 'psql'))
     print("Average usage:")